@@ -138,14 +138,15 @@ class Query:
             raise InvalidResultCount(len(expected_keys), len(result_keys))
         if result_keys != expected_keys:
             raise InvalidResultColumnNames()
+        # map column names to their position in rows
+        indexes = {key: index for index, key in enumerate(query_results.keys)}
         results = []
         for row in query_results.rows:
-            values = dict(zip(query_results.keys, row))
             for metric in self.metrics:
                 metric_result = MetricResult(
                     metric.name,
-                    values[metric.name],
-                    {label: values[label] for label in metric.labels},
+                    row[indexes[metric.name]],
+                    {label: row[indexes[label]] for label in metric.labels},
                 )
                 results.append(metric_result)
         return results
@@ -237,7 +238,7 @@ class DataBase:
     async def execute(self, query: Query) -> List[MetricResult]:
         """Execute a query."""
         await self.connect()
-        self._logger.debug(f'running query "{query.name}" on database "{self.name}"')
+        self._logger.debug('running query "%s" on database "%s"', query.name, self.name)
         self._pending_queries += 1
         self._conn: Connection
         try:
@@ -3,15 +3,20 @@
 import asyncio
 from collections import defaultdict
 from decimal import Decimal
-from logging import Logger
+from logging import (
+    DEBUG,
+    Logger,
+)
 from typing import (
     Any,
+    Callable,
     Dict,
     Iterable,
     List,
     Mapping,
     Optional,
     Set,
+    Tuple,
 )
 
 from prometheus_aioexporter import MetricsRegistry
@@ -54,6 +59,13 @@ class QueryLoop:
         self._periodic_calls: Dict[str, PeriodicCall] = {}
         # map query names to list of database names
         self._doomed_queries: Dict[str, Set[str]] = defaultdict(set)
+        # map metric names to the method used to update them
+        self._metric_methods: Dict[str, str] = {}
+        # map database names to their static labels for metrics
+        self._database_labels: Dict[str, Dict[str, str]] = {}
+        # map (metric, database) names to the bound method updating the metric,
+        # for updates with no labels from query results
+        self._metric_updates: Dict[Tuple[str, str], Callable[[Any], None]] = {}
         self._setup()
 
     async def start(self):
@@ -95,6 +107,13 @@ class QueryLoop:
         """Initialize instance attributes."""
         for database in self._databases:
             database.set_logger(self._logger)
+            self._database_labels[database.name] = {
+                DATABASE_LABEL: database.name,
+                **database.labels,
+            }
+
+        for name, metric in self._config.metrics.items():
+            self._metric_methods[name] = self._METRIC_METHODS[metric.type]
 
         for query in self._config.queries.values():
             if query.interval is None:
@@ -119,13 +138,14 @@ class QueryLoop:
             self._increment_queries_count(db, "error")
             if error.fatal:
                 self._logger.debug(
-                    f'removing doomed query "{query.name}" ' f'for database "{dbname}"'
+                    'removing doomed query "%s" for database "%s"', query.name, dbname
                 )
                 self._doomed_queries[query.name].add(dbname)
             return
 
+        update_metric = self._update_metric
         for result in results:
-            self._update_metric(db, result.metric, result.value, labels=result.labels)
+            update_metric(db, result.metric, result.value, labels=result.labels)
         self._increment_queries_count(db, "success")
 
     async def _remove_if_dooomed(self, query: Query, dbname: str) -> bool:
@@ -161,19 +181,28 @@ class QueryLoop:
             value = 0.0
         elif isinstance(value, Decimal):
             value = float(value)
-        method = self._METRIC_METHODS[self._config.metrics[name].type]
-        all_labels = {DATABASE_LABEL: database.name}
-        all_labels.update(database.labels)
+        method = self._metric_methods[name]
+        all_labels = self._database_labels.get(database.name)
+        if all_labels is None:
+            # not a configured database, use its own labels
+            all_labels = {DATABASE_LABEL: database.name, **database.labels}
         if labels:
-            all_labels.update(labels)
-        labels_string = ",".join(
-            f'{label}="{value}"' for label, value in sorted(all_labels.items())
-        )
-        self._logger.debug(
-            f'updating metric "{name}" {method} {value} {{{labels_string}}}'
-        )
-        metric = self._registry.get_metric(name, labels=all_labels)
-        getattr(metric, method)(value)
+            all_labels = {**all_labels, **labels}
+        if self._logger.isEnabledFor(DEBUG):
+            labels_string = ",".join(
+                f'{label}="{value}"' for label, value in sorted(all_labels.items())
+            )
+            self._logger.debug(
+                'updating metric "%s" %s %s {%s}', name, method, value, labels_string
+            )
+        key = (name, database.name)
+        update = None if labels else self._metric_updates.get(key)
+        if update is None:
+            metric = self._registry.get_metric(name, labels=all_labels)
+            update = getattr(metric, method)
+            if not labels:
+                self._metric_updates[key] = update
+        update(value)
 
     def _increment_queries_count(self, database: DataBase, status: str):
         """Increment count of queries in a status for a database."""
@@ -1,5 +1,4 @@
 import asyncio
-from collections import defaultdict
 from decimal import Decimal
 import logging
 
@@ -44,7 +43,7 @@ async def make_query_loop(tmpdir, config_data, registry):
         with config_file.open() as fh:
             config = load_config(fh, logging.getLogger())
         registry.create_metrics(config.metrics.values())
-        query_loop = QueryLoop(config, registry, logging)
+        query_loop = QueryLoop(config, registry, logging.getLogger())
         query_loops.append(query_loop)
         return query_loop
 
@@ -66,16 +65,16 @@ def metric_values(metric, by_labels=()):
     elif metric._type == "counter":
         suffix = "_total"
 
-    values = defaultdict(list)
-    for sample_suffix, labels, value in metric._samples():
-        if sample_suffix == suffix:
-            if by_labels:
-                label_values = tuple(labels[label] for label in by_labels)
-                values[label_values] = value
-            else:
-                values[sample_suffix].append(value)
-
-    return values if by_labels else values[suffix]
+    samples = [
+        (labels, value)
+        for sample_suffix, labels, value in metric._samples()
+        if sample_suffix == suffix
+    ]
+    if not by_labels:
+        return [value for _, value in samples]
+    return {
+        tuple(labels[label] for label in by_labels): value for labels, value in samples
+    }
 
 
 @pytest.mark.asyncio
@@ -165,6 +164,57 @@ class TestQueryLoop:
         assert value == 100.123
         assert isinstance(value, float)
 
+    async def test_update_metric_unconfigured_database(self, registry, make_query_loop):
+        """Metrics can be updated for a database not in the config."""
+        db = DataBase("other", f"sqlite://")
+        query_loop = make_query_loop()
+        query_loop._update_metric(db, "m", 100.0)
+        metric = registry.get_metric("m")
+        assert metric_values(metric, by_labels=("database",)) == {("other",): 100.0}
+
+    async def test_update_metric_cached(self, mocker, registry, make_query_loop):
+        """Metrics without result labels are looked up only once."""
+        db = DataBase("db", f"sqlite://")
+        query_loop = make_query_loop()
+        get_metric = mocker.spy(registry, "get_metric")
+        query_loop._update_metric(db, "m", 100.0)
+        query_loop._update_metric(db, "m", 200.0)
+        assert get_metric.call_count == 1
+        assert ("m", "db") in query_loop._metric_updates
+        metric = registry.get_metric("m")
+        assert metric_values(metric) == [200.0]
+
+    async def test_update_metric_with_labels_not_cached(
+        self, mocker, registry, make_query_loop
+    ):
+        """Metrics with result labels are looked up on each update."""
+        db = DataBase("db", f"sqlite://")
+        query_loop = make_query_loop()
+        get_metric = mocker.spy(registry, "get_metric")
+        query_loop._increment_queries_count(db, "success")
+        assert ("queries", "db") not in query_loop._metric_updates
+        # a cached method for the metric and database is not used either
+        cached_update = mocker.Mock()
+        query_loop._metric_updates[("queries", "db")] = cached_update
+        query_loop._increment_queries_count(db, "success")
+        cached_update.assert_not_called()
+        assert get_metric.call_count == 2
+        queries_metric = registry.get_metric("queries")
+        assert metric_values(queries_metric, by_labels=("status",)) == {
+            ("success",): 2.0
+        }
+
+    async def test_update_metric_no_log_if_debug_disabled(
+        self, mocker, caplog, make_query_loop
+    ):
+        """No debug message is built on metric update if debug is disabled."""
+        db = DataBase("db", f"sqlite://")
+        query_loop = make_query_loop()
+        mock_debug = mocker.patch.object(query_loop._logger, "debug")
+        caplog.set_level(logging.INFO)
+        query_loop._update_metric(db, "m", 100.0)
+        mock_debug.assert_not_called()
+
     async def test_run_query_log(self, caplog, query_tracker, query_loop):
         """Debug messages are logged on query execution."""
         caplog.set_level(logging.DEBUG)